@@ -0,0 +1,37 @@
+
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from layout_common import decode_source, fix_layout_content, iter_tsx, report_failures, update_layout, write_with_backup
+
+# Apply the layout update and layout clean-up to one file, reading and
+# writing it only once. The JSX fixes are not part of this pass: their
+# props rewrite would mangle the wrapper update_layout has just written,
+# and fix_jsx_advanced.py only ever writes separate *_fixed.tsx copies.
+def process_file(file_path):
+    with open(file_path, "rb") as f:
+        content = decode_source(f.read())
+
+    content, layout_changed = update_layout(content)
+    fixed_content, cleanup_changed, skipped = fix_layout_content(content)
+    note = f" ({skipped} unbalanced wrapper(s) left in place)" if skipped else ""
+
+    if not (layout_changed or cleanup_changed):
+        return f"Unchanged {file_path}{note}"
+
+    backup_path = write_with_backup(file_path, fixed_content)
+
+    return f"Fixed {file_path} and created backup at {backup_path}{note}"
+
+if __name__ == "__main__":
+    # Recursively find all .tsx files
+    tsx_files = list(iter_tsx('.'))
+
+    # Run both fixes for each file in parallel; files are independent
+    with ProcessPoolExecutor() as ex:
+        results = list(ex.map(partial(report_failures, process_file), tsx_files, chunksize=16))
+
+    # Print results in a single write
+    if results:
+        sys.stdout.write("\n".join(results) + "\n")
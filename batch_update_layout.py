@@ -1,5 +1,8 @@
 
 import os
+import sys
+
+from layout_common import update_layout
 
 # List of converter component files to update
 converter_files = [
@@ -15,70 +18,60 @@ converter_files = [
 ]
 
 # Layout import line
-layout_import = "import { TwoColumnLayout } from './Layout/TwoColumnLayout';
-"
+layout_import = "import { TwoColumnLayout } from './Layout/TwoColumnLayout';\n"
+
+# Sidecar marker suffix recording that a file has already been migrated
+MIGRATED_SUFFIX = ".migrated"
+
+# Modification time and size identifying the current version of a file
+def file_signature(file_path):
+    st = os.stat(file_path)
+    return f"{st.st_mtime_ns} {st.st_size}"
+
+# Record a file as migrated so later runs can skip it without reading it
+def mark_migrated(file_path):
+    with open(file_path + MIGRATED_SUFFIX, "w") as f:
+        f.write(file_signature(file_path))
+
+# A marker only counts while the file is unchanged since it was written
+def is_marked_migrated(file_path):
+    try:
+        with open(file_path + MIGRATED_SUFFIX, "r") as f:
+            return f.read() == file_signature(file_path)
+    except OSError:
+        return False
 
 # Function to update a file
 def update_file(file_path):
     if not os.path.exists(file_path):
         return f"Skipped {file_path}: file not found."
 
+    # A marker from a previous run means the file needs no read at all
+    if is_marked_migrated(file_path):
+        return f"Skipped {file_path}: marker present."
+
     with open(file_path, "r", encoding="utf-8") as f:
         content = f.read()
 
     # Skip if already updated
     if "TwoColumnLayout" in content:
+        mark_migrated(file_path)
         return f"Skipped {file_path}: already updated."
 
-    # Add import after SEO import
-    if "import SEO from" in content:
-        content = content.replace("import SEO from", layout_import + "import SEO from")
-    else:
-        content = layout_import + content
-
-    # Try to locate two layout divs with w-full lg:w-1/2
-    parts = content.split('<div className="w-full lg:w-1/2')
-    if len(parts) < 3:
+    # Add the import and wrap the two layout divs in TwoColumnLayout
+    new_content, changed = update_layout(content, layout_import)
+    if not changed:
         return f"Skipped {file_path}: layout structure not found."
 
-    before = parts[0]
-    input_div = '<div className="w-full lg:w-1/2' + parts[1].split('</div>', 1)[0] + '</div>'
-    output_div = '<div className="w-full lg:w-1/2' + parts[2].split('</div>', 1)[0] + '</div>'
-    after = '</div>'.join(parts[2].split('</div>')[1:])
-
-    # Create layout wrapper
-    layout_wrapper = f"""
-<TwoColumnLayout
-  left={{
-    header: <h2 className="text-xl font-semibold">Input Section</h2>,
-    content: (
-      {input_div}
-    ),
-    scrollable: true,
-    minHeight: "500px"
-  }}
-  right={{
-    header: <h2 className="text-xl font-semibold">Output Section</h2>,
-    content: (
-      {output_div}
-    ),
-    scrollable: true,
-    minHeight: "500px"
-  }}
-/>
-"""
-
-    # Replace old layout with new wrapper
-    new_content = before + layout_wrapper + after
-
     with open(file_path, "w", encoding="utf-8") as f:
         f.write(new_content)
+    mark_migrated(file_path)
 
     return f"Updated {file_path} successfully."
 
 # Run update for each file
 results = [update_file(f) for f in converter_files]
 
-# Print results
-for res in results:
-    print(res)
+# Print results in a single write
+if results:
+    sys.stdout.write("\n".join(results) + "\n")
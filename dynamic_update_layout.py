@@ -1,75 +1,75 @@
 
+import mmap
 import os
+import queue
+import sys
+import threading
 
-# Layout import line
-layout_import = "import { TwoColumnLayout } from './Layout/TwoColumnLayout';"
+from layout_common import LAYOUT_IMPORT, MMAP_THRESHOLD, decode_source, iter_tsx, report_failures, update_layout
 
+# Number of threads transforming files while the walk is still running
+WORKER_COUNT = os.cpu_count() or 4
 
 # Function to update a file
 def update_file(file_path):
-    with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    with open(file_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        # Skip already updated files on the raw bytes, before decoding them
+        if size < MMAP_THRESHOLD:
+            raw = f.read()
+            if b"TwoColumnLayout" in raw:
+                return f"Skipped {file_path}: already updated."
+            content = decode_source(raw)
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b"TwoColumnLayout") != -1:
+                    return f"Skipped {file_path}: already updated."
+                content = decode_source(mm[:])
 
-    # Skip if already updated
-    if "TwoColumnLayout" in content:
-        return f"Skipped {file_path}: already updated."
-
-    # Add import after SEO import
-    if "import SEO from" in content:
-        content = content.replace("import SEO from", layout_import + "import SEO from")
-    else:
-        content = layout_import + content
-
-    # Try to locate two layout divs with w-full lg:w-1/2
-    parts = content.split('<div className="w-full lg:w-1/2')
-    if len(parts) < 3:
+    new_content, changed = update_layout(content, LAYOUT_IMPORT)
+    if not changed:
         return f"Skipped {file_path}: layout structure not found."
 
-    before = parts[0]
-    input_div = '<div className="w-full lg:w-1/2' + parts[1].split('</div>', 1)[0] + '</div>'
-    output_div = '<div className="w-full lg:w-1/2' + parts[2].split('</div>', 1)[0] + '</div>'
-    after = '</div>'.join(parts[2].split('</div>')[1:])
-
-    # Create layout wrapper
-    layout_wrapper = f"""
-<TwoColumnLayout
-  left={{
-    header: <h2 className="text-xl font-semibold">Input Section</h2>,
-    content: (
-      {input_div}
-    ),
-    scrollable: true,
-    minHeight: "500px"
-  }}
-  right={{
-    header: <h2 className="text-xl font-semibold">Output Section</h2>,
-    content: (
-      {output_div}
-    ),
-    scrollable: true,
-    minHeight: "500px"
-  }}
-/>
-"""
-
-    # Replace old layout with new wrapper
-    new_content = before + layout_wrapper + after
-
     with open(file_path, "w", encoding="utf-8") as f:
         f.write(new_content)
 
     return f"Updated {file_path} successfully."
 
-# Recursively find all .tsx files
-tsx_files = []
-for root, _, files in os.walk('.'):
-    for file in files:
-        if file.endswith(".tsx"):
-            tsx_files.append(os.path.join(root, file))
+# Walk the tree and queue .tsx files as they are found
+def walk_tsx_files(q, worker_count):
+    try:
+        for file_path in iter_tsx('.'):
+            q.put(file_path)
+    finally:
+        # One sentinel per worker signals the end of the walk, even if it failed
+        for _ in range(worker_count):
+            q.put(None)
+
+# Update queued files until the walker's sentinel arrives
+def update_worker(q, results):
+    while True:
+        file_path = q.get()
+        if file_path is None:
+            return
+        # A failure on one file is reported without stopping the worker
+        results.append(report_failures(update_file, file_path))
 
-# Run update for each file
-results = [update_file(f) for f in tsx_files]
+if __name__ == "__main__":
+    # Workers start transforming files while the walk is still in progress
+    q = queue.Queue()
+    results = []
+    walker = threading.Thread(target=walk_tsx_files, args=(q, WORKER_COUNT))
+    workers = [
+        threading.Thread(target=update_worker, args=(q, results))
+        for _ in range(WORKER_COUNT)
+    ]
+    walker.start()
+    for worker in workers:
+        worker.start()
+    walker.join()
+    for worker in workers:
+        worker.join()
 
-# Print results
-for res in results:
-    print(res)
+    # Print results in a single write
+    if results:
+        sys.stdout.write("\n".join(results) + "\n")
@@ -1,36 +1,63 @@
 import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from layout_common import EXCLUDED_DIRS, report_failures
 
 # Directory to scan for .tsx files
 PROJECT_DIR = './components'
 
+# Precompiled JSX fix patterns
+_MAP_RE = re.compile(r"\{tabOrder\.map\(\(lang, index\) => \{")
+_PROPS_RE = re.compile(r"\),\s*scrollable:\s*true,\s*minHeight:\s*\"500px\"")
+
 # JSX fixer function
 def fix_jsx(content):
     # Fix common malformed map blocks and misplaced props
-    content = re.sub(
-        r"\{tabOrder\.map\(\(lang, index\) => \{",
-        r"{tabOrder.map((lang, index) => {\n  const { label, icon } = languageDetails[lang];\n  return (",
-        content
-    )
-    content = re.sub(
-        r"\),\s*scrollable:\s*true,\s*minHeight:\s*\"500px\"",
-        r"\)})\n},\nscrollable: true,\nminHeight: \"500px\"",
-        content
-    )
+    # Cheap substring checks skip the regex scan on files that cannot match
+    if "tabOrder.map" in content:
+        content = _MAP_RE.sub(
+            r"{tabOrder.map((lang, index) => {\n  const { label, icon } = languageDetails[lang];\n  return (",
+            content
+        )
+    if "scrollable" in content and "minHeight" in content:
+        content = _PROPS_RE.sub(
+            r"\)})\n},\nscrollable: true,\nminHeight: \"500px\"",
+            content
+        )
     return content
 
-# Process all .tsx files in the directory
-for root, _, files in os.walk(PROJECT_DIR):
-    for file in files:
-        if file.endswith('.tsx'):
-            file_path = os.path.join(root, file)
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+# Fix a single .tsx file in place
+def fix_file(file_path):
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    fixed_content = fix_jsx(content)
+    if fixed_content is content or fixed_content == content:
+        return f"Unchanged {file_path}"
+
+    # Overwrite the original file with corrected content
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(fixed_content)
+
+    return f"Corrected JSX syntax in: {file_path}"
 
-            fixed_content = fix_jsx(content)
+if __name__ == "__main__":
+    # Collect all .tsx files in the directory
+    tsx_files = []
+    for root, dirs, files in os.walk(PROJECT_DIR, topdown=True):
+        # Prune excluded directories in place so os.walk never descends into them
+        dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
+        for file in files:
+            if file.endswith('.tsx'):
+                tsx_files.append(os.path.join(root, file))
 
-            # Overwrite the original file with corrected content
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(fixed_content)
+    # Process files in parallel; each file is fixed independently
+    with ProcessPoolExecutor() as ex:
+        results = list(ex.map(partial(report_failures, fix_file), tsx_files, chunksize=16))
 
-            print(f"Corrected JSX syntax in: {file_path}")
+    # Print results in a single write
+    if results:
+        sys.stdout.write("\n".join(results) + "\n")
@@ -1,43 +1,69 @@
 import os
-import re
+import sys
+
+# Prefer the third-party regex module, a drop-in replacement for re with
+# better worst-case behaviour on the lazy className pattern below
+try:
+    import regex as re
+except ImportError:
+    import re
+
+from layout_common import EXCLUDED_DIRS
 
 # Directory to scan for .tsx files
 PROJECT_DIR = '.'
 
+# Precompiled JSX fix patterns
+_MAP_RE = re.compile(r"\{tabOrder\.map\(\(lang, index\) => \{")
+_PROPS_RE = re.compile(r"\),\s*scrollable:\s*true,\s*minHeight:\s*\"500px\"")
+_SHAD_RE = re.compile(r'(className=\"[^\"]*?)shad\n')
+
 # JSX fixer function
 def fix_jsx(content):
     # Fix common malformed map blocks and misplaced props
-    content = re.sub(
-        r"\{tabOrder\.map\(\(lang, index\) => \{",
-        r"{tabOrder.map((lang, index) => {\n  const { label, icon } = languageDetails[lang];\n  return (",
-        content
-    )
-    content = re.sub(
-        r"\),\s*scrollable:\s*true,\s*minHeight:\s*\"500px\"",
-        r"\)})\nscrollable: true,\nminHeight: \"500px\"",
-        content
-    )
+    # Cheap substring checks skip the regex scan on files that cannot match
+    if "tabOrder.map" in content:
+        content = _MAP_RE.sub(
+            r"{tabOrder.map((lang, index) => {\n  const { label, icon } = languageDetails[lang];\n  return (",
+            content
+        )
+    if "scrollable" in content and "minHeight" in content:
+        content = _PROPS_RE.sub(
+            r"\)})\nscrollable: true,\nminHeight: \"500px\"",
+            content
+        )
     # Fix incomplete JSX tags ending with 'shad' or similar
-    content = re.sub(
-        r'(className=\"[^\"]*?)shad\n',
-        r'\1shadow\">',
-        content
-    )
+    if "shad\n" in content:
+        content = _SHAD_RE.sub(
+            r'\1shadow\">',
+            content
+        )
     return content
 
-# Process all .tsx files in the directory
-for root, _, files in os.walk(PROJECT_DIR):
-    for file in files:
-        if file.endswith('.tsx'):
-            file_path = os.path.join(root, file)
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+if __name__ == "__main__":
+    # Process all .tsx files in the directory
+    msgs = []
+    for root, dirs, files in os.walk(PROJECT_DIR, topdown=True):
+        # Prune excluded directories in place so os.walk never descends into them
+        dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
+        for file in files:
+            if file.endswith('.tsx'):
+                file_path = os.path.join(root, file)
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+
+                fixed_content = fix_jsx(content)
+                if fixed_content is content or fixed_content == content:
+                    msgs.append(f"Unchanged {file_path}")
+                    continue
 
-            fixed_content = fix_jsx(content)
+                # Save to a new file with _fixed suffix
+                fixed_path = os.path.join(root, file.replace('.tsx', '_fixed.tsx'))
+                with open(fixed_path, 'w', encoding='utf-8') as f:
+                    f.write(fixed_content)
 
-            # Save to a new file with _fixed suffix
-            fixed_path = os.path.join(root, file.replace('.tsx', '_fixed.tsx'))
-            with open(fixed_path, 'w', encoding='utf-8') as f:
-                f.write(fixed_content)
+                msgs.append(f"Fixed JSX syntax in: {fixed_path}")
 
-            print(f"Fixed JSX syntax in: {fixed_path}")
+    # Print results in a single write
+    if msgs:
+        sys.stdout.write("\n".join(msgs) + "\n")
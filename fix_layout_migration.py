@@ -1,58 +1,47 @@
 
+import mmap
 import os
-import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
-layout_import = "import { TwoColumnLayout } from './Layout/TwoColumnLayout';
-"
+from layout_common import MMAP_THRESHOLD, decode_source, fix_layout_content, iter_tsx, report_failures, write_with_backup
 
 # Function to clean and fix layout migration
 def fix_layout(file_path):
-    with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    with open(file_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            content = decode_source(f.read())
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Skip files without the layout before decoding them
+                if mm.find(b"TwoColumnLayout") == -1:
+                    return f"Skipped {file_path}: TwoColumnLayout not used."
+                content = decode_source(mm[:])
 
     if "TwoColumnLayout" not in content:
         return f"Skipped {file_path}: TwoColumnLayout not used."
 
-    # Backup original file
-    backup_path = file_path + ".bak"
-    shutil.copyfile(file_path, backup_path)
-
-    # Remove leftover <div className="w-full lg:w-1/2 ..."> wrappers inside content blocks
-    # Replace them with React Fragments <></>
-    lines = content.splitlines()
-    new_lines = []
-    skip = False
-    for line in lines:
-        if '<div className="w-full lg:w-1/2' in line:
-            skip = True
-            new_lines.append('<>')
-            continue
-        if skip and '</div>' in line:
-            new_lines.append('</>')
-            skip = False
-            continue
-        if not skip:
-            new_lines.append(line)
-
-    # Fix any missing closing braces or parentheses
-    fixed_content = "
-".join(new_lines)
-
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(fixed_content)
-
-    return f"Fixed {file_path} and created backup at {backup_path}"
-
-# Recursively find all .tsx files
-tsx_files = []
-for root, _, files in os.walk('.'):
-    for file in files:
-        if file.endswith(".tsx"):
-            tsx_files.append(os.path.join(root, file))
-
-# Run fix for each file
-results = [fix_layout(f) for f in tsx_files]
-
-# Print results
-for res in results:
-    print(res)
+    fixed_content, changed, skipped = fix_layout_content(content)
+    note = f" ({skipped} unbalanced wrapper(s) left in place)" if skipped else ""
+
+    # Leave the file (and its backup) alone when nothing changed
+    if not changed:
+        return f"Unchanged {file_path}{note}"
+
+    backup_path = write_with_backup(file_path, fixed_content)
+
+    return f"Fixed {file_path} and created backup at {backup_path}{note}"
+
+if __name__ == "__main__":
+    # Recursively find all .tsx files
+    tsx_files = list(iter_tsx('.'))
+
+    # Run fix for each file in parallel; files are independent
+    with ProcessPoolExecutor() as ex:
+        results = list(ex.map(partial(report_failures, fix_layout), tsx_files, chunksize=16))
+
+    # Print results in a single write
+    if results:
+        sys.stdout.write("\n".join(results) + "\n")
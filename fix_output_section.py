@@ -3,6 +3,7 @@
 
 with open('components/OnlineFormatterWithToolbar.tsx', 'r', encoding='utf-8') as f:
     content = f.read()
+original_content = content
 
 # Change 1: Update Output heading - replace Clear button with Save and Copy
 old_heading = '''            {/* Output heading with View selector and Exit fullscreen button */}
@@ -50,7 +51,12 @@ new_heading = '''            {/* Output heading with View selector and Exit full
                 </div>
               </div>'''
 
-content = content.replace(old_heading, new_heading)
+# Splice at the located offset; the textarea block is searched from here on
+search_start = 0
+idx = content.find(old_heading)
+if idx >= 0:
+    content = content[:idx] + new_heading + content[idx + len(old_heading):]
+    search_start = idx + len(new_heading)
 
 # Change 2: Update output textarea icons - replace D, C, S with Download emoji, Clear emoji only
 old_textarea = '''            <div className="flex-grow w-full rounded-md overflow-hidden flex flex-col border border-slate-200 dark:border-slate-700 min-h-0 relative">
@@ -113,11 +119,16 @@ new_textarea = '''            <div className="flex-grow w-full rounded-md overfl
                 </Tooltip>
               </div>'''
 
-content = content.replace(old_textarea, new_textarea)
+idx = content.find(old_textarea, search_start)
+if idx >= 0:
+    content = content[:idx] + new_textarea + content[idx + len(old_textarea):]
 
-with open('components/OnlineFormatterWithToolbar.tsx', 'w', encoding='utf-8') as f:
-    f.write(content)
+if content == original_content:
+    print("No changes needed - output section is already up to date.")
+else:
+    with open('components/OnlineFormatterWithToolbar.tsx', 'w', encoding='utf-8') as f:
+        f.write(content)
 
-print("✓ Output section heading updated - Save (💾) and Copy (📋) moved next to 'Output'")
-print("✓ Output textarea icons updated - Download (📥) and Clear (🧹) now in textarea")
-print("All changes applied successfully!")
+    print("✓ Output section heading updated - Save (💾) and Copy (📋) moved next to 'Output'")
+    print("✓ Output textarea icons updated - Download (📥) and Clear (🧹) now in textarea")
+    print("All changes applied successfully!")
@@ -0,0 +1,221 @@
+
+import os
+import re
+import shutil
+
+# Shared helpers for the TwoColumnLayout migration scripts
+
+# Layout import line
+LAYOUT_IMPORT = "import { TwoColumnLayout } from './Layout/TwoColumnLayout';"
+
+# Directories never worth scanning for source .tsx files
+EXCLUDED_DIRS = {'node_modules', '.git', 'dist', 'build', '.next'}
+
+# Files smaller than this are read directly; mmap setup costs more than it saves
+MMAP_THRESHOLD = 16384
+
+# Opening of the w-full lg:w-1/2 layout divs
+LAYOUT_DIV = '<div className="w-full lg:w-1/2'
+
+# Fixed parts of the TwoColumnLayout wrapper around the input and output divs
+LW_PREFIX = """
+<TwoColumnLayout
+  left={
+    header: <h2 className="text-xl font-semibold">Input Section</h2>,
+    content: (
+      """
+LW_MID = """
+    ),
+    scrollable: true,
+    minHeight: "500px"
+  }
+  right={
+    header: <h2 className="text-xl font-semibold">Output Section</h2>,
+    content: (
+      """
+LW_SUFFIX = """
+    ),
+    scrollable: true,
+    minHeight: "500px"
+  }
+/>
+"""
+
+# Matches the input and output w-full lg:w-1/2 layout divs in one pass
+LAYOUT_RE = re.compile(
+    r'(<div className="w-full lg:w-1/2[^>]*>.*?</div>).*?(<div className="w-full lg:w-1/2[^>]*>.*?</div>)',
+    re.DOTALL
+)
+
+# Matches the opening tag of a leftover <div className="w-full lg:w-1/2 ..."> wrapper
+_WRAPPER_OPEN_RE = re.compile(r'<div className="w-full lg:w-1/2[^"]*"[^>]*>')
+
+# Matches any opening or closing div tag; `=>` is allowed inside JSX attributes
+_DIV_TAG_RE = re.compile(r'<div\b(?:=>|[^>])*>|</div>')
+
+# Text that ends a TwoColumnLayout content block written by update_layout
+_BLOCK_END = "\n    ),\n    scrollable: true,"
+
+
+# Decode raw bytes the way text-mode open() would (universal newlines)
+def decode_source(raw):
+    content = raw.decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+# Recursively yield .tsx files, skipping directories that cannot be read
+def iter_tsx(path):
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in EXCLUDED_DIRS:
+                    yield from iter_tsx(entry.path)
+            elif entry.name.endswith(".tsx") and entry.is_file():
+                yield entry.path
+
+
+# Run a per-file step, reporting a failure on that one file as its result
+# instead of raising, so one bad file cannot abort a whole parallel run
+def report_failures(func, file_path):
+    try:
+        return func(file_path)
+    except (OSError, UnicodeDecodeError) as e:
+        return f"Failed {file_path}: {e}"
+
+
+# Cheap structural check run before LAYOUT_RE: the first layout div must close
+# before the second opens, and the second must close. Files failing this are
+# skipped, since the lazy regex backtracks quadratically on them.
+def has_layout_pair(content):
+    first = content.find(LAYOUT_DIV)
+    if first < 0:
+        return False
+    second = content.find(LAYOUT_DIV, first + len(LAYOUT_DIV))
+    if second < 0:
+        return False
+    close = content.find("</div>", first)
+    return 0 <= close < second and content.find("</div>", second) >= 0
+
+
+# Wrap the input/output divs in TwoColumnLayout; returns (content, changed)
+def update_layout(content, layout_import=LAYOUT_IMPORT):
+    # Skip if already updated
+    if "TwoColumnLayout" in content:
+        return content, False
+
+    original = content
+
+    # Add import after SEO import
+    if "import SEO from" in content:
+        content = content.replace("import SEO from", layout_import + "import SEO from")
+    else:
+        content = layout_import + content
+
+    # Try to locate two layout divs with w-full lg:w-1/2
+    if not has_layout_pair(content):
+        return original, False
+    m = LAYOUT_RE.search(content)
+    if m is None:
+        return original, False
+
+    before = content[:m.start()]
+    input_div = m.group(1)
+    output_div = m.group(2)
+    after = content[m.end():]
+
+    # Create layout wrapper
+    layout_wrapper = LW_PREFIX + input_div + LW_MID + output_div + LW_SUFFIX
+
+    # Replace old layout with new wrapper
+    return before + layout_wrapper + after, True
+
+
+# Replace leftover layout div wrappers with fragments; returns (content, changed,
+# skipped), where skipped counts wrappers left alone because no balanced end exists
+def fix_layout_content(content):
+    if "TwoColumnLayout" not in content:
+        return content, False, 0
+
+    # Remove leftover <div className="w-full lg:w-1/2 ..."> wrappers inside content blocks
+    # Replace them with React Fragments <></>
+    parts = []
+    pos = 0
+    skipped = 0
+    for m in _WRAPPER_OPEN_RE.finditer(content):
+        if m.start() < pos:
+            continue
+        close = _find_wrapper_close(content, m.end())
+        if close is None:
+            skipped += 1
+            continue
+        close_start, close_end, fragment_close = close
+        parts.append(content[pos:m.start()])
+        parts.append("<>")
+        parts.append(content[m.end():close_start])
+        parts.append(fragment_close)
+        pos = close_end
+
+    if not parts:
+        return content, False, skipped
+    parts.append(content[pos:])
+    return "".join(parts), True, skipped
+
+
+# Locate the end of a wrapper div whose opening tag ends at `start` by counting
+# nested div depth. Returns (start, end, fragment close) for the text to replace,
+# or None when no balanced end exists. update_layout cuts each div at its first
+# inner </div>, so a wrapper inside a content block may have lost its own closing
+# tag; if its body is balanced up to the end of the block, the fragment is closed
+# there instead.
+def _find_wrapper_close(content, start):
+    block_end = content.find(_BLOCK_END, start)
+    depth = 1
+    for tag in _DIV_TAG_RE.finditer(content, start):
+        if 0 <= block_end < tag.start():
+            break
+        if tag.group() == "</div>":
+            depth -= 1
+            if depth == 0:
+                return tag.start(), tag.end(), "</>"
+        elif not tag.group().endswith("/>"):
+            depth += 1
+    if block_end >= 0 and depth == 1:
+        return block_end, block_end, "\n      </>"
+    return None
+
+
+# Write content to file_path, keeping the previous version at file_path + ".bak"
+def write_with_backup(file_path, content):
+    # Backup original file by moving it aside; the fixed content is written
+    # to a fresh file, so no bytes need to be copied. A symlink is copied
+    # instead, so the new content is written through it to the link target.
+    backup_path = file_path + ".bak"
+    moved = False
+    if not os.path.islink(file_path):
+        try:
+            os.replace(file_path, backup_path)
+            moved = True
+        except OSError:
+            pass
+    if not moved:
+        shutil.copyfile(file_path, backup_path)
+
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    if moved:
+        # The fresh file keeps the original's permission bits and, where the
+        # process is allowed to set it, its ownership
+        shutil.copymode(backup_path, file_path)
+        st = os.stat(backup_path)
+        try:
+            os.chown(file_path, st.st_uid, st.st_gid)
+        except (AttributeError, OSError):
+            pass
+
+    return backup_path
@@ -0,0 +1,159 @@
+# Regression check for the layout migration scripts.
+# apply_layout_fixes.py must leave every .tsx file exactly as running
+# dynamic_update_layout.py and then fix_layout_migration.py would, and
+# every fragment it writes into a TwoColumnLayout content block must be
+# balanced.
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from layout_common import fix_layout_content, update_layout
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+COMPONENTS_DIR = os.path.join(ROOT, "components")
+
+# Body of a TwoColumnLayout content block written by update_layout
+CONTENT_BLOCK_RE = re.compile(r'    content: \(\n(.*?)\n    \),\n    scrollable', re.DOTALL)
+
+# Opening (non self-closing) and closing div tags
+DIV_OPEN_RE = re.compile(r'<div\b(?:=>|[^>])*(?<!/)>')
+DIV_CLOSE_RE = re.compile(r'</div>')
+
+
+# Copy components/ into a fresh tree and run the given scripts on it in order;
+# returns the tree and the last script's output
+def run_scripts(tmp_dir, name, scripts):
+    tree = os.path.join(tmp_dir, name)
+    shutil.copytree(COMPONENTS_DIR, os.path.join(tree, "components"))
+    output = ""
+    for script in scripts:
+        output = subprocess.run(
+            [sys.executable, os.path.join(ROOT, script)],
+            cwd=tree, check=True, capture_output=True, text=True
+        ).stdout
+    return tree, output
+
+
+# Map each .tsx file's relative path to its contents
+def read_tsx_files(tree):
+    files = {}
+    for root, _, names in os.walk(tree):
+        for name in names:
+            if name.endswith(".tsx"):
+                path = os.path.join(root, name)
+                with open(path, "r", encoding="utf-8") as f:
+                    files[os.path.relpath(path, tree)] = f.read()
+    return files
+
+
+# A wrapper with nested divs must become a fragment around its whole body
+def check_nested_wrapper():
+    source = (
+        '<TwoColumnLayout />\n'
+        '<div className="w-full lg:w-1/2 flex">\n'
+        '  <div className="row"><div>inner</div></div>\n'
+        '  <div onClick={() => go()}>x</div>\n'
+        '</div>\n'
+    )
+    expected = (
+        '<TwoColumnLayout />\n'
+        '<>\n'
+        '  <div className="row"><div>inner</div></div>\n'
+        '  <div onClick={() => go()}>x</div>\n'
+        '</>\n'
+    )
+    fixed, changed, skipped = fix_layout_content(source)
+    assert changed and not skipped and fixed == expected, "Nested wrapper not unwrapped: " + repr(fixed)
+
+    # A wrapper with no balanced end is left alone and reported
+    unbalanced = '<TwoColumnLayout />\n<div className="w-full lg:w-1/2 flex">\n  <div>\n'
+    fixed, changed, skipped = fix_layout_content(unbalanced)
+    assert not changed and skipped == 1 and fixed == unbalanced, "Unbalanced wrapper was rewritten"
+
+
+# A small component must come out of both steps exactly as expected
+def check_migration_fixture():
+    source = (
+        "import SEO from './SEO';\n"
+        '  <div className="flex">\n'
+        '    <div className="w-full lg:w-1/2 p-4">\n'
+        '      <textarea />\n'
+        '    </div>\n'
+        '    <div className="w-full lg:w-1/2 p-4">\n'
+        '      <pre>{output}</pre>\n'
+        '    </div>\n'
+        '  </div>\n'
+    )
+    expected = (
+        "import { TwoColumnLayout } from './Layout/TwoColumnLayout';import SEO from './SEO';\n"
+        '  <div className="flex">\n'
+        '    \n'
+        '<TwoColumnLayout\n'
+        '  left={\n'
+        '    header: <h2 className="text-xl font-semibold">Input Section</h2>,\n'
+        '    content: (\n'
+        '      <>\n'
+        '      <textarea />\n'
+        '    </>\n'
+        '    ),\n'
+        '    scrollable: true,\n'
+        '    minHeight: "500px"\n'
+        '  }\n'
+        '  right={\n'
+        '    header: <h2 className="text-xl font-semibold">Output Section</h2>,\n'
+        '    content: (\n'
+        '      <>\n'
+        '      <pre>{output}</pre>\n'
+        '    </>\n'
+        '    ),\n'
+        '    scrollable: true,\n'
+        '    minHeight: "500px"\n'
+        '  }\n'
+        '/>\n'
+        '\n'
+        '  </div>\n'
+    )
+    migrated, _ = update_layout(source)
+    fixed, changed, skipped = fix_layout_content(migrated)
+    assert changed and not skipped and fixed == expected, "Unexpected migration output: " + repr(fixed)
+
+
+# Every content block holding a fragment must balance both fragments and divs;
+# blocks left without one must belong to a file the driver reported
+def check_content_blocks(files, output):
+    reported = {
+        os.path.normpath(line.split()[1]) for line in output.splitlines()
+        if "unbalanced wrapper" in line
+    }
+    for path, text in files.items():
+        for block in CONTENT_BLOCK_RE.findall(text):
+            if "<>" not in block:
+                assert path in reported, f"Unfixed content block not reported in {path}"
+                continue
+            assert block.count("<>") == block.count("</>"), f"Unbalanced fragment in {path}"
+            assert len(DIV_OPEN_RE.findall(block)) == len(DIV_CLOSE_RE.findall(block)), \
+                f"Unbalanced div inside fragment in {path}"
+
+
+if __name__ == "__main__":
+    check_nested_wrapper()
+    check_migration_fixture()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        sequential_tree, _ = run_scripts(
+            tmp_dir, "sequential", ["dynamic_update_layout.py", "fix_layout_migration.py"]
+        )
+        sequential = read_tsx_files(sequential_tree)
+        fused_tree, fused_output = run_scripts(tmp_dir, "fused", ["apply_layout_fixes.py"])
+        fused = read_tsx_files(fused_tree)
+
+    assert sequential.keys() == fused.keys(), "Driver produced a different set of .tsx files"
+    mismatched = sorted(path for path in sequential if sequential[path] != fused[path])
+    assert not mismatched, "Driver output differs for: " + ", ".join(mismatched)
+    assert not any("\\)})" in text for text in fused.values()), "Driver wrote escaped JSX"
+    check_content_blocks(fused, fused_output)
+
+    print(f"Layout regression check passed ({len(fused)} files)")